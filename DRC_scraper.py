@@ -2,7 +2,8 @@
 Web scraper for downloading laws as HTML & PDF files from
 http://www.leganet.cd/JO.htm
 - the national law repository of the Democratic Republic of the Congo (DRC) -
-using a Selenium Chrome bot.
+using a Selenium Chrome bot to discover the law links
+and aiohttp to download them all concurrently.
 
 Author: Magali de Bruyn
 Updated: December 20, 2021
@@ -10,6 +11,10 @@ Updated: December 20, 2021
 
 ## Install libraries through console
 ## ! pip install selenium
+## ! pip install aiohttp
+## ! pip install aiofiles
+## ! pip install aiohttp-client-cache # optional - http caching for re-runs
+## ! pip install lxml
 ## ! pip install pdfkit
 ### ! brew install homebrew/cask/wkhtmltopdf
 
@@ -23,46 +28,116 @@ Updated: December 20, 2021
 # Download from https://chromedriver.chromium.org/downloads
 # based on Chrome version (version 96.0 for my local machine)
 
+import asyncio
+import atexit
 from datetime import date
+import functools
+import hashlib
 import json
 import os
 from os import path
 from urllib.parse import urlparse
 import re
-import requests
+import aiofiles
+import aiohttp
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from bs4 import BeautifulSoup
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+import urllib3
+from bs4 import BeautifulSoup, SoupStrainer
+
+# Optional http cache: makes development re-runs nearly free, since
+# unchanged pages are answered by conditional GETs (304, no body)
+try:
+    from aiohttp_client_cache import CachedSession, SQLiteBackend
+except ImportError:
+    CachedSession = None
 
 
 # Define class constants
 START_URL = 'http://www.leganet.cd/JO.htm' # 'http://www.ejustice.just.fgov.be/loi/loi.htm'
 DOWNLOAD_PATH = './data/DRC/'
-METADATA = []
-METADATA_PATH = './data/DRC/metadata.json'
+METADATA_PATH = './data/DRC/metadata.jsonl'
+SEEN_PATH = './data/DRC/seen.bin'
+HTTP_CACHE_PATH = './data/DRC/http_cache.sqlite'
 COUNTRY = 'DRC'
+# Cap on simultaneous downloads - enough to hide network latency
+# without hammering the (fragile) server
+MAX_CONCURRENT_REQUESTS = 64
+MAX_RETRIES = 3
+
+# Resolve the script directory and download root once, not per law
+_DIRNAME = os.path.dirname(__file__)
+_DOWNLOAD_BASE = os.path.join(_DIRNAME, DOWNLOAD_PATH)
 
 # Create fake user agent to bypass anti-robot walls
 FAKE_USER_AGENT = 'Mozilla/5.0 (Windows NT 4.0; WOW64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/37.0.2049.0 Safari/537.36'
 
+# Compile the filename-slug pattern once instead of per law
+_NON_WORD = re.compile(r'\W+')
+
 ### GENERALIZABLE CODE
 ### Can be reused for other countries' websites
 
+# Selenium talks to chromedriver over http with a connection pool of
+# maxsize=1 by default, causing pool-full warnings and TCP reconnects
+# between commands; enlarge the pool and keep connections alive
+def _enlarge_webdriver_pool(maxsize=32):
+    def _get_connection_manager(self):
+        return urllib3.PoolManager(maxsize=maxsize, block=False,
+                                   timeout=self.get_timeout())
+    RemoteConnection._get_connection_manager = _get_connection_manager
+
+_enlarge_webdriver_pool()
+
 class ChromeBot:
     def __init__(self, headless=False):
         # Specify the driver chromebot
         options = Options()
+        # Return from driver.get() at DOMContentLoaded instead of waiting
+        # for every trailing subresource - wait_for gates anything that
+        # genuinely needs more time
+        options.page_load_strategy = 'eager'
         # Open chrome window or not?
-        options.headless = headless
+        if headless:
+            options.add_argument('--headless=new')
+        # Trim Chrome's background work: no gpu, extensions, tab throttling,
+        # crash reporting, audio or image loading - none of it helps text scraping
+        for argument in ['--disable-dev-shm-usage', '--disable-gpu',
+                         '--disable-extensions',
+                         '--disable-background-timer-throttling',
+                         '--disable-backgrounding-occluded-windows',
+                         '--disable-renderer-backgrounding',
+                         '--disable-breakpad', '--mute-audio', '--no-sandbox',
+                         '--blink-settings=imagesEnabled=false']:
+            options.add_argument(argument)
         # Add fake user agent to bypass anti-robot walls
         options.add_argument(f'user-agent={FAKE_USER_AGENT}')
+        # Add custom profile to block images and stylesheets
+        profile = {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+        }
+        options.add_experimental_option("prefs", profile)
         # Specify chromedriver location
         s = Service("./chromedriver")
-        # Define driver with above specifications 
+        # Define driver with above specifications
         self.driver = webdriver.Chrome(service=s, options=options)
+        # No implicit waiting - every lookup that needs to wait
+        # does so explicitly via wait_for
+        self.driver.implicitly_wait(0)
+        # Block the static assets the prefs can't reach (fonts, css, media) -
+        # only the html itself is ever read
+        self.driver.execute_cdp_cmd('Network.enable', {})
+        self.driver.execute_cdp_cmd('Network.setBlockedURLs', {
+            'urls': ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.woff',
+                     '*.woff2', '*.css', '*.svg']})
         print('\nChrome bot initialized!')
 
     def navigate_to(self, url):
@@ -97,166 +172,298 @@ class ChromeBot:
         tab = self.driver.window_handles[tab_id]
         self.driver.switch_to.window(tab)
 
-    def switch_to_frame(self, frame_xpath: str):
-        frame = self.driver.find_element(By.XPATH, frame_xpath)
-        self.driver.switch_to.frame(frame)
+    def switch_to_frame(self, frame_name: str, timeout=5):
+        # Switch by frame name/index - the driver resolves it directly,
+        # saving the find-element round-trip an XPath lookup would cost
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                EC.frame_to_be_available_and_switch_to_it(frame_name))
+        except TimeoutException:
+            print('FAILED: Chrome bot timed out waiting for specified frame.')
+
+    def wait_for(self, xpath, timeout=5):
+        """Wait explicitly until the element at xpath is present, then return it."""
+        try:
+            return WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located((By.XPATH, xpath)))
+        except TimeoutException:
+            print('FAILED: Chrome bot timed out waiting for specified xpath.')
+
+# Share one bot per process - Chrome startup takes seconds,
+# so repeated runs (e.g. from a task queue) should reuse the driver
+_BOT_SINGLETON = None
 
-    def wait_sec(self, time_sec):
-        self.driver.implicitly_wait(time_sec)
+def get_bot(headless=True):
+    """Return the shared ChromeBot, creating it lazily on first use."""
+    global _BOT_SINGLETON
+    # Rebuild if no bot exists yet or its session has been torn down
+    if _BOT_SINGLETON is None or _BOT_SINGLETON.driver.session_id is None:
+        _BOT_SINGLETON = ChromeBot(headless)
+        # Make sure Chrome is shut down when the process exits
+        atexit.register(_BOT_SINGLETON.driver.quit)
+    return _BOT_SINGLETON
 
-def create_destination_file(law_name: str, law_text: str = '', type: str = 'txt', language: str = 'french'):
+@functools.lru_cache(maxsize=None)
+def destination_dir(language: str, type: str):
+    """Resolve (and create, exactly once) the directory for a language/file-type pair."""
+    directory = os.path.join(_DOWNLOAD_BASE, language, type)
+    os.makedirs(directory, exist_ok=True)
+    return directory
+
+def create_destination_file(law_name: str, law_text: str = '', type: str = 'txt', language: str = 'french', already: set = None):
     """
     Define a name and file path for any law based on title, content, and desired file type
     """
     # Shorten and format the title and sample text
-    title = re.sub(' ', '-', re.sub('\W+',' ', law_name+law_text)).lower()[:250]
+    # A single pass of the precompiled pattern replaces the old
+    # two-pass re.sub(' ', '-', re.sub('\W+', ' ', ...)) dance
+    title = _NON_WORD.sub('-', law_name+law_text).strip('-').lower()[:250]
     ## Some files have the same title but are in fact different laws!
     ## i.e. the content is different. Hence, adding words from the law's text
     ## to differentiate titles & laws
     # Create the path by combining relevant variables
-    file_path = DOWNLOAD_PATH + language + '/' + type + '/' + title + '.' + type
-    destination_file = os.path.join(os.path.dirname(__file__), file_path)
+    filename = title + '.' + type
+    destination_file = os.path.join(destination_dir(language, type), filename)
     print("DOWNLOADING: ", destination_file)
-    # Check that the file does not already exist
-    if path.exists(destination_file):
+    # Check that the file does not already exist - against the cached
+    # directory listing when available, instead of a stat() per law
+    if already is not None:
+        if filename in already:
+            print(destination_file + " is already downloaded. Not re-downloading.")
+            return
+        already.add(filename)
+    elif path.exists(destination_file):
         print(destination_file + " is already downloaded. Not re-downloading.")
         return
     return destination_file
 
-def append_to_metadata(law_name: str, file_link: str, filename: str, language: str = 'french'):
-    """Append a new entry to the METADATA list."""
-    METADATA.append({'title': law_name,
-                     'link': file_link,
-                     'download_path': filename,
-                     'download_date': date.today().strftime('%Y-%m-%d'),
-                     'language': language,
-                     'country': COUNTRY})
-    print('Added item to METADATA.')
-
-def write_metadata_json():
-    """Write the metadata to a json file."""
-    dirname = os.path.dirname(__file__)
-    metadata_path = os.path.join(dirname, METADATA_PATH)
-    with open(metadata_path, 'w') as file:
-        json.dump(METADATA, file)
-    print('\nWrote metadata to JSON.')
+def url_hash(key: str):
+    """Hash a url (or other stable key) down to 8 bytes."""
+    return hashlib.blake2b(key.encode(), digest_size=8).digest()
+
+def load_seen_hashes():
+    """Load the set of 8-byte hashes of laws processed on previous runs."""
+    seen_path = os.path.join(_DIRNAME, SEEN_PATH)
+    if not path.exists(seen_path):
+        return set()
+    with open(seen_path, 'rb') as f:
+        raw = f.read()
+    return {raw[i:i+8] for i in range(0, len(raw), 8)}
+
+def record_seen(seen: set, law_hash: bytes):
+    """Remember a processed law in memory and on disk."""
+    seen.add(law_hash)
+    with open(os.path.join(_DIRNAME, SEEN_PATH), 'ab') as f:
+        f.write(law_hash)
+
+def metadata_entry(law_name: str, file_link: str, filename: str, language: str = 'french'):
+    """Build the metadata record for one law."""
+    return {'title': law_name,
+            'link': file_link,
+            'download_path': filename,
+            'download_date': date.today().strftime('%Y-%m-%d'),
+            'language': language,
+            'country': COUNTRY}
+
+async def write_metadata_jsonl(queue):
+    """Stream metadata entries to the jsonl file as downloads finish.
+
+    A single writer task owns the file: one json line per law, so a
+    crash loses at most the current entry and memory use stays flat.
+    """
+    metadata_path = os.path.join(_DIRNAME, METADATA_PATH)
+    async with aiofiles.open(metadata_path, 'a') as file:
+        while True:
+            entry = await queue.get()
+            if entry is None: # Sentinel - all downloads are done
+                break
+            await file.write(json.dumps(entry) + '\n')
+            print('Added item to metadata.')
 
 
 ### COUNTRY-SPECIFIC CODE
 ### For DRC (Congo): from www.leganet.cd/JO.htm
 
+def extract_law_title(soup):
+    """Pull the law title out of the parsed page, or None if there is none."""
+    ## Titles are not consistently formatted across html pages
+    ## so trying different selectors, each anchored on the second table's
+    ## third cell (the content column) like the original XPaths
+    ## If none of these work, the link is probably broken (404 error)-
+    ## a handful of them are, unfortunately
+    for selector in ['table:nth-of-type(2) td:nth-of-type(3) p',
+                     'table:nth-of-type(2) td:nth-of-type(3) span p',
+                     'table:nth-of-type(2) td:nth-of-type(3) div dl',
+                     'table:nth-of-type(2) td:nth-of-type(3) dl dt',
+                     'table:nth-of-type(2) td:nth-of-type(3) font b p']:
+        heading = soup.select_one(selector)
+        if heading is not None and heading.get_text(strip=True):
+            return heading.get_text(strip=True)[0:250]
+    return None
+
+async def fetch_law(session, semaphore, url, language, metadata_queue, already, seen):
+    """Download one law page and write it to disk."""
+    # Limit how many downloads run at once
+    async with semaphore:
+        # Retry with exponential backoff on failures and non-2xx responses
+        for attempt in range(MAX_RETRIES):
+            try:
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                    if response.status != 200:
+                        print(f'\nGot status {response.status} for: {url}')
+                        await asyncio.sleep(2 ** attempt)
+                        continue
+                    if 'pdf' in url:
+                        content = await response.read()
+                    else:
+                        # Honor the declared charset, but don't trust it to
+                        # be declared: these Latin-1-era pages sometimes omit
+                        # it, and aiohttp would then decode as strict utf-8
+                        content = await response.read()
+                        try:
+                            text_html = content.decode(response.get_encoding())
+                        except (UnicodeDecodeError, LookupError):
+                            text_html = content.decode('latin-1', errors='replace')
+                break
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                print(f'\nCould not access this page: {url}')
+                await asyncio.sleep(2 ** attempt)
+        else: # All retries failed
+            print(f'\nGiving up on: {url}')
+            return
+    # Some of the links lead to PDFs, some to html files - not consistent
+    # Treating them seperably
+    if 'pdf' in url: # If it's a PDF link
+        # Get PDF title from url path through parsing
+        pdf_path = urlparse(url).path
+        law_title = os.path.splitext(pdf_path)[0][1:]
+        # Announce law
+        print('\nFound law: ', law_title)
+        # Create destination file from law title name
+        destination_file = create_destination_file(law_name=law_title, type='pdf', language=language, already=already)
+        # Check if file was already downloaded
+        if destination_file is not None:  # Unless file was already downloaded
+            # Write response as binary file
+            async with aiofiles.open(destination_file, 'wb') as f:
+                await f.write(content)
+            # Hand the metadata entry to the writer task
+            await metadata_queue.put(metadata_entry(law_title, url, destination_file))
+    else: # If it's not a PDF, it's a HTML page (on this website)
+        # Use Beautiful Soup to get Unicode string
+        # lxml parses several times faster than html.parser, and the body
+        # strainer skips building a tree for <head>/<script>
+        soup = BeautifulSoup(text_html, 'lxml', parse_only=SoupStrainer('body'))
+        # Get title
+        law_title = extract_law_title(soup)
+        if law_title is None:
+            print(f"\nThe link for this law is probably broken (404 error). You can check manually using the law's link: {url}")
+            return
+        # Announce law
+        print('\nFound law: ', law_title)
+        text_soup = soup.get_text()
+        text_mid = round(len(text_soup)/2)
+        # Display what it's about
+        content_extract = text_soup[text_mid:text_mid+250]
+        # Create file
+        destination_file = create_destination_file(law_title, content_extract, 'txt', language, already=already)
+        # Check if file was already downloaded
+        if destination_file is not None:
+            # Write text file
+            # Encode once and write bytes through a large buffer -
+            # no codec state machine or newline translation per write
+            async with aiofiles.open(destination_file, 'wb', buffering=65536) as f:
+                await f.write(text_soup.encode('utf-8'))
+            # Hand the metadata entry to the writer task
+            await metadata_queue.put(metadata_entry(law_title, url, destination_file, language))
+    # Remember this url so future runs skip it without downloading
+    record_seen(seen, url_hash(url))
+
+async def fetch_all_laws(urls, language, already, seen):
+    """Download all law pages concurrently over one http session."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    # All metadata entries funnel through one queue into a single writer task
+    metadata_queue = asyncio.Queue()
+    writer = asyncio.create_task(write_metadata_jsonl(metadata_queue))
+    # Reuse connections across requests instead of reconnecting per law
+    connector = aiohttp.TCPConnector(limit_per_host=16, limit=MAX_CONCURRENT_REQUESTS)
+    if CachedSession is not None:
+        # Cache responses on disk for a day; laws on leganet.cd are
+        # effectively immutable, so re-runs revalidate instead of re-downloading
+        session = CachedSession(cache=SQLiteBackend(os.path.join(_DIRNAME, HTTP_CACHE_PATH),
+                                                    expire_after=86400),
+                                headers={'User-Agent': FAKE_USER_AGENT},
+                                connector=connector)
+    else:
+        session = aiohttp.ClientSession(headers={'User-Agent': FAKE_USER_AGENT},
+                                        connector=connector)
+    try:
+        async with session:
+            # return_exceptions keeps one bad law from aborting the whole
+            # batch - the baseline skipped failing laws one at a time too
+            results = await asyncio.gather(*[fetch_law(session, semaphore, url, language, metadata_queue, already, seen)
+                                             for url in urls],
+                                           return_exceptions=True)
+            for url, result in zip(urls, results):
+                if isinstance(result, Exception):
+                    print(f'\nCould not process this law: {url} ({result})')
+    finally:
+        # Shut the writer down even if a download task raised - otherwise
+        # asyncio.run would cancel it mid-write and lose queued entries
+        await metadata_queue.put(None)
+        await writer
+
 def scrape_drc_laws(headless=True):
     """Scrape all DRC laws from http://www.leganet.cd/JO.htm"""
 
     # Define language
     language = 'french'
-    # Initialize Selenium Chrome bot
-    bot = ChromeBot(headless)
+    # Get the shared Selenium Chrome bot
+    bot = get_bot(headless)
     # Navigate to start url
     bot.navigate_to(START_URL)
-    bot.wait_sec(5)
     # Access laws listing page
-    # Access XPath
-    laws_list_link = bot.find_xpath_solo("//img[@alt='Législation']")
+    # Wait for the entry link instead of a blanket implicit wait
+    laws_list_link = bot.wait_for("//img[@alt='Législation']")
     # Stop if a problem occured
     if laws_list_link is None:
         return
     # Click on button to acess list of laws
     laws_list_link.click()
-    bot.wait_sec(2)
-    # Find all the law links
-    all_links = bot.find_xpath("//*[contains(text(), 'Texte') or contains(text(), 'texte') or contains(text(), 'pdf')]")
-    # Keep track of total laws and listing pages
-    laws_ttl = len(all_links)
-    print(f'Laws to download on the page: {len(all_links)}')
+    # Collect the law urls once - the pages can be fetched directly,
+    # no need to click through browser tabs one by one
+    bot.wait_for("//a[@target='_blank']")
+    all_links = bot.find_xpath("//a[@target='_blank']")
+    hrefs = [link.get_attribute('href') for link in all_links]
+    hrefs = [href for href in hrefs if href]
+    # Skip laws processed on a previous run and collapse the duplicate
+    # links on the listing page - an 8-byte hash lookup instead of a
+    # full page download (some pages appear under several links)
+    seen = load_seen_hashes()
+    fresh_hrefs = []
+    batch_hashes = set()
+    for href in hrefs:
+        law_hash = url_hash(href)
+        if law_hash in seen or law_hash in batch_hashes:
+            continue
+        batch_hashes.add(law_hash)
+        fresh_hrefs.append(href)
+    hrefs = fresh_hrefs
+    # Keep track of total laws
+    laws_ttl = len(hrefs)
+    print(f'Laws to download on the page: {laws_ttl}')
     print(f'{laws_ttl} laws discovered so far in total')
+    # The browser stays warm for the next run; atexit quits it on shutdown
 
-    # Iterate over all download links; click on it, scrape the law, come back to previous page
-    for i in range(len(all_links)): # For testing purposes, use: range(0, 1) or range(len(all_links)-5, len(all_links))
-        try:
-            # Click on law, access page
-            all_links[i].click()
-            # Switch (bot) to tab containing the law
-            bot.wait_sec(5)
-            bot.switch_to_tab(1)
-            # Get url of page
-            file_source_url = bot.get_url()
-            # Some of the links lead to PDFs, some to html files - not consistent
-            # Treating them seperably
-            if 'pdf' in file_source_url: # If it's a PDF link
-                # Get PDF title from url path through parsing
-                pdf_path = urlparse(file_source_url).path
-                law_title = os.path.splitext(pdf_path)[0][1:]
-                # Announce law
-                print(f'\nFound law ({i+1}/{len(all_links)}): ', law_title)
-                # Create destination file from law title name
-                destination_file = create_destination_file(law_name=law_title, type='pdf', language=language)
-                # Check if file was already downloaded
-                if destination_file is not None:  # Unless file was already downloaded
-                    # Get HTML response (pdf content)
-                    response = requests.get(file_source_url, stream=True)
-                    # Write response as binary file
-                    with open(destination_file, 'wb') as f:
-                        f.write(response.content)
-                    # Add entry to metadata
-                    append_to_metadata(law_title, file_source_url, destination_file)
-            else: # If it's not a PDF, it's a HTML page (on this website)
-                file_source_url = bot.get_url()
-                # Get title
-                ## Titles are not consistently formatted across html pages
-                ## so trying different XPaths
-                ## If none of these work, the link is probably broken (404 error)-
-                ## a handful of them are, unfortunately
-                continue_cond = True
-                try:
-                    law_title = bot.find_xpath_solo("/html/body/table[2]/tbody/tr/td[3]/p[1]").text[0:250]
-                except:
-                    try:
-                        law_title = bot.find_xpath_solo("/html/body/table[2]/tbody/tr/td[3]/span[1]/p").text[0:250]
-                    except:
-                        try:
-                            law_title = bot.find_xpath_solo("/html/body/table[2]/tbody/tr/td[3]/div[1]/dl[1]").text[0:250]
-                        except:
-                            try:
-                                law_title = bot.find_xpath_solo("/html/body/table[2]/tbody/tr/td[3]/dl/dt[1]").text[0:250]
-                            except:
-                                try:
-                                    law_title = bot.find_xpath_solo("/html/body/table[2]/tbody/tr/td[3]/font[1]/b/p").text[0:250]
-                                except:
-                                    print(f"\nThe link for this law is probably broken (404 error). You can check manually using the law's link: {file_source_url}")
-                                    continue_cond = False
-                if continue_cond:
-                    # Announce law
-                    print(f'\nFound law ({i+1}/{len(all_links)}): ', law_title)
-                    # Get box with text
-                    bot.find_xpath_solo("/html/body/table[2]/tbody/tr/td[3]") #//td[@valign='top']")
-                    # Get html text
-                    text_html = bot.get_html()
-                    # Use Beautiful Soup to get Unicode string
-                    soup = BeautifulSoup(text_html, features="html.parser")
-                    text_soup = soup.get_text()
-                    text_mid = round(len(text_soup)/2)
-                    # Display what it's about
-                    content_extract = text_soup[text_mid:text_mid+250]
-                    # Create file
-                    destination_file = create_destination_file(law_title, content_extract, 'txt', language)
-                    # Check if file was already downloaded
-                    if destination_file is not None:
-                        # Write text file
-                        with open(destination_file, 'w') as f:
-                            f.write(text_soup)
-                        # Add entry metadata for this law
-                        append_to_metadata(law_title, file_source_url, destination_file, language)
-            # Close active tab and move on
-            bot.wait_sec(2)
-            bot.driver.close()
-            bot.switch_to_tab(0)
-            bot.wait_sec(1)
-        except:
-            print("\nCould not access the link.")
+    # List the existing downloads once and check membership per law,
+    # instead of one stat() syscall per law
+    already = set()
+    for type in ('txt', 'pdf'):
+        already.update(os.listdir(destination_dir(language, type)))
+
+    # Download all the laws concurrently
+    asyncio.run(fetch_all_laws(hrefs, language, already, seen))
 
-    # Write all metadata to JSON
-    write_metadata_json()
+    # Metadata has been streamed to the jsonl file along the way
     print(f'\n{laws_ttl} laws discovered in total')
     print('\nCode finished running!\n')
 
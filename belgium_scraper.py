@@ -27,7 +27,11 @@ Updated: December 20, 2021
 # Download from https://chromedriver.chromium.org/downloads
 # based on Chrome version (version 96.0 for my local machine)
 
+import atexit
+import concurrent.futures
 from datetime import date
+import functools
+import hashlib
 import json
 import os
 from os import path
@@ -38,38 +42,87 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from bs4 import BeautifulSoup
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
+import urllib3
 
 
 # Define class constants
 START_URL = 'http://www.ejustice.just.fgov.be/cgi/welcome.pl' # 'http://www.ejustice.just.fgov.be/loi/loi.htm'
 DOWNLOAD_PATH = './data/belgium/'
-METADATA = []
-METADATA_PATH = './data/belgium/metadata.json'
+METADATA_PATH = './data/belgium/metadata.jsonl'
+SEEN_PATH = './data/belgium/seen.bin'
 COUNTRY = 'Belgium'
 LANGUAGES = {'french': 'Français', 'dutch': 'Nederlands', 'german': 'Deutsch'}
 
+# Resolve the script directory and download root once, not per law
+_DIRNAME = os.path.dirname(__file__)
+_DOWNLOAD_BASE = os.path.join(_DIRNAME, DOWNLOAD_PATH)
+
 
 # Create fake user agent to bypass anti-robot walls
 FAKE_USER_AGENT = 'Mozilla/5.0 (Windows NT 4.0; WOW64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/37.0.2049.0 Safari/537.36'
 
+# Compile the filename-slug pattern once instead of per law
+_NON_WORD = re.compile(r'\W+')
+
 ### GENERALIZABLE CODE
 ### Can be reused for other countries' websites
 
+# Selenium talks to chromedriver over http with a connection pool of
+# maxsize=1 by default, causing pool-full warnings and TCP reconnects
+# between commands; enlarge the pool and keep connections alive
+def _enlarge_webdriver_pool(maxsize=32):
+    def _get_connection_manager(self):
+        return urllib3.PoolManager(maxsize=maxsize, block=False,
+                                   timeout=self.get_timeout())
+    RemoteConnection._get_connection_manager = _get_connection_manager
+
+_enlarge_webdriver_pool()
+
 class ChromeBot:
     def __init__(self, headless=False):
         options = Options()
-        options.headless = headless
+        # Return from driver.get() at DOMContentLoaded instead of waiting
+        # for every trailing subresource - wait_for gates anything that
+        # genuinely needs more time
+        options.page_load_strategy = 'eager'
+        if headless:
+            options.add_argument('--headless=new')
+        # Trim Chrome's background work: no gpu, extensions, tab throttling,
+        # crash reporting, audio or image loading - none of it helps text scraping
+        for argument in ['--disable-dev-shm-usage', '--disable-gpu',
+                         '--disable-extensions',
+                         '--disable-background-timer-throttling',
+                         '--disable-backgrounding-occluded-windows',
+                         '--disable-renderer-backgrounding',
+                         '--disable-breakpad', '--mute-audio', '--no-sandbox',
+                         '--blink-settings=imagesEnabled=false']:
+            options.add_argument(argument)
         options.add_argument(f'user-agent={FAKE_USER_AGENT}')
 
         # Add custom profile to disactivate PDF viewer
+        # and block images and stylesheets
         profile = {
             "plugins.plugins_list": [{"enabled": False,
                                          "name": "Chrome PDF Viewer"}],
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
         }
         options.add_experimental_option("prefs", profile)
         s = Service("./chromedriver")
         self.driver = webdriver.Chrome(service=s, options=options)
+        # No implicit waiting - every lookup that needs to wait
+        # does so explicitly via wait_for
+        self.driver.implicitly_wait(0)
+        # Block the static assets the prefs can't reach (fonts, css, media) -
+        # only the html itself is ever read
+        self.driver.execute_cdp_cmd('Network.enable', {})
+        self.driver.execute_cdp_cmd('Network.setBlockedURLs', {
+            'urls': ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.woff',
+                     '*.woff2', '*.css', '*.svg']})
         print('\nChrome bot initialized!')
 
     def navigate_to(self, url):
@@ -97,157 +150,311 @@ class ChromeBot:
     def switch_to_default(self):
         self.driver.switch_to.default_content()
 
-    def switch_to_frame(self, frame_xpath: str):
-        frame = self.driver.find_element(By.XPATH, frame_xpath)
-        self.driver.switch_to.frame(frame)
+    def switch_to_frame(self, frame_name: str, timeout=5):
+        # Switch by frame name/index - the driver resolves it directly,
+        # saving the find-element round-trip an XPath lookup would cost
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                EC.frame_to_be_available_and_switch_to_it(frame_name))
+        except TimeoutException:
+            print('FAILED: Chrome bot timed out waiting for specified frame.')
 
-    def wait_sec(self, time_sec):
-        self.driver.implicitly_wait(time_sec)
+    def wait_for(self, xpath, timeout=5):
+        """Wait explicitly until the element at xpath is present, then return it."""
+        try:
+            return WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located((By.XPATH, xpath)))
+        except TimeoutException:
+            print('FAILED: Chrome bot timed out waiting for specified xpath.')
 
-def create_destination_file(law_name: str = 'Untitled', law_text: str = '', type: str = 'txt', language: str = 'french'):
+    def wait_until_stale(self, element, timeout=5):
+        """Wait explicitly until a navigation has detached the given element."""
+        try:
+            WebDriverWait(self.driver, timeout).until(EC.staleness_of(element))
+        except TimeoutException:
+            print('FAILED: Chrome bot timed out waiting for the page to change.')
+
+# Share one bot per process - Chrome startup takes seconds,
+# so repeated runs (e.g. from a task queue) should reuse the driver
+_BOT_SINGLETON = None
+
+def get_bot(headless=True):
+    """Return the shared ChromeBot, creating it lazily on first use."""
+    global _BOT_SINGLETON
+    # Rebuild if no bot exists yet or its session has been torn down
+    if _BOT_SINGLETON is None or _BOT_SINGLETON.driver.session_id is None:
+        _BOT_SINGLETON = ChromeBot(headless)
+        # Make sure Chrome is shut down when the process exits
+        atexit.register(_BOT_SINGLETON.driver.quit)
+    return _BOT_SINGLETON
+
+@functools.lru_cache(maxsize=None)
+def destination_dir(language: str, type: str):
+    """Resolve (and create, exactly once) the directory for a language/file-type pair."""
+    directory = os.path.join(_DOWNLOAD_BASE, language, type)
+    os.makedirs(directory, exist_ok=True)
+    return directory
+
+def create_destination_file(law_name: str = 'Untitled', law_text: str = '', type: str = 'txt', language: str = 'french', already: set = None):
     """
     Define a name and file path for any law based on title, content, and desired file type
     """
     # Shorten and format the title and first words
-    title = re.sub(' ', '-', re.sub('\W+',' ', law_name)).lower()[:200]
+    # A single pass of the precompiled pattern replaces the old
+    # two-pass re.sub(' ', '-', re.sub('\W+', ' ', ...)) dance
+    title = _NON_WORD.sub('-', law_name).strip('-').lower()[:200]
     ## Some files have the same title but are in fact different laws!
     ## i.e. the content is different. Hence, adding words from the law's text
     ## to differentiate titles & laws
-    law_text = re.sub(' ', '-', re.sub('\W+',' ', law_text)).lower()[:50]
+    law_text = _NON_WORD.sub('-', law_text).strip('-').lower()[:50]
     # Create the path by combining relevant variables
-    file_path = DOWNLOAD_PATH + language + '/' + type + '/' + title + law_text + '.' + type
-    destination_file = os.path.join( os.path.dirname(__file__), file_path)
-    # Check that the file does not already exist
-    if path.exists(destination_file):
+    filename = title + law_text + '.' + type
+    destination_file = os.path.join(destination_dir(language, type), filename)
+    # Check that the file does not already exist - against the cached
+    # directory listing when available, instead of a stat() per law
+    if already is not None:
+        if filename in already:
+            print(destination_file + " is already downloaded. Not re-downloading.")
+            return
+        already.add(filename)
+    elif path.exists(destination_file):
         print(destination_file + " is already downloaded. Not re-downloading.")
         return
     return destination_file
 
+def url_hash(key: str):
+    """Hash a url (or other stable key) down to 8 bytes."""
+    return hashlib.blake2b(key.encode(), digest_size=8).digest()
+
+def load_seen_hashes():
+    """Load the set of 8-byte hashes of laws processed on previous runs."""
+    seen_path = os.path.join(_DIRNAME, SEEN_PATH)
+    if not path.exists(seen_path):
+        return set()
+    with open(seen_path, 'rb') as f:
+        raw = f.read()
+    return {raw[i:i+8] for i in range(0, len(raw), 8)}
+
+def record_seen(seen: set, law_hash: bytes):
+    """Remember a processed law in memory and on disk."""
+    seen.add(law_hash)
+    with open(os.path.join(_DIRNAME, SEEN_PATH), 'ab') as f:
+        f.write(law_hash)
+
+def metadata_language_path(language: str):
+    """Per-language metadata file, so concurrent processes never share a writer."""
+    return os.path.join(_DOWNLOAD_BASE, 'metadata_' + language + '.jsonl')
+
 def append_to_metadata(law_name: str, file_link: str, filename: str, language: str):
-    """Append a new entry to the METADATA list."""
-    METADATA.append({'title': law_name,
-                     'link': file_link,
-                     'download_path': filename,
-                     'download_date': date.today().strftime('%Y-%m-%d'),
-                     'language': language,
-                     'country': COUNTRY})
-    print('Added item to METADATA.')
-
-def write_metadata_json():
-    """Write the metadata to a json file."""
-    dirname = os.path.dirname(__file__)
-    metadata_path = os.path.join(dirname, METADATA_PATH)
-    with open(metadata_path, 'w') as f:
-        json.dump(METADATA, f)
-    print('\nWrote metadata to JSON.')
+    """Append a new entry to this language's metadata jsonl file.
+
+    One json line per law: a crash loses at most the current entry,
+    and memory use stays flat no matter how many laws are scraped.
+    """
+    entry = {'title': law_name,
+             'link': file_link,
+             'download_path': filename,
+             'download_date': date.today().strftime('%Y-%m-%d'),
+             'language': language,
+             'country': COUNTRY}
+    with open(metadata_language_path(language), 'a') as f:
+        f.write(json.dumps(entry) + '\n')
+    print('Added item to metadata.')
+
+def merge_metadata():
+    """Concatenate the per-language metadata files into the main jsonl file."""
+    metadata_path = os.path.join(_DIRNAME, METADATA_PATH)
+    with open(metadata_path, 'w') as merged:
+        for language in LANGUAGES:
+            language_path = metadata_language_path(language)
+            if path.exists(language_path):
+                with open(language_path) as f:
+                    merged.write(f.read())
+    print('\nMerged per-language metadata into ' + METADATA_PATH)
 
 
 ### COUNTRY-SPECIFIC CODE
 ### For Belgium: from www.ejustice.just.fgov.be
 
-def scrape_belgium_laws(headless=True):
-    """Scrape all Belgian laws from www.ejustice.just.fgov.be"""
-
-    # Initialize Selenium Chrome bot
-    bot = ChromeBot(headless)
+def crawl_belgium_language(bot, language):
+    """Crawl every law listing for one language with the given bot."""
 
     # Each law page (and corresponding file) has the same source url
     # i.e. each law page is only accessible via navigation from the start url
     # not directly (on this website)
     file_source_url = 'www.ejustice.just.fgov.be/cgi/article.pl'
 
-    for language in list(LANGUAGES):
-        print(f'\nSearching for laws in {language}')
-        # Navigate to start url
-        bot.navigate_to(START_URL)
-        # Access language button & corresponding laws listing page
-        # Access XPath
-        laws_list_link = bot.find_xpath_solo("//input[@type='Submit' and @value='{}']".format(LANGUAGES.get(language))) # dynamic XPath
-        # Stop if a problem occured
-        if laws_list_link is None:
-            return
-        # Click on button
-        laws_list_link.click()
-        # Keep track of total laws and listing pages
-        laws_ttl = 0
-        listings_num = 0
-        # Initialize IDs (use proxy - their date) of listing pages
-        this_page = '.'
-        old_page = ''
-        # Switch to main frame for later navigation
-        bot.switch_to_default()
-
-        # Iterate through all the listing pages for this language
-        while this_page != old_page: # Next listing page is available
-            # Access & collect link to each law on the page
-            # Switch to frame
-            listings_num += 1
-            print(f'\nOn the listing page number {listings_num}')
+    # Hashes of laws processed on previous runs; every law page here
+    # shares the same url, so language + numac is the stable key
+    seen = load_seen_hashes()
+
+    # Navigate to start url
+    bot.navigate_to(START_URL)
+    # Access language button & corresponding laws listing page
+    # Wait for the button instead of a blanket implicit wait
+    laws_list_link = bot.wait_for("//input[@type='Submit' and @value='{}']".format(LANGUAGES.get(language))) # dynamic XPath
+    # Stop if a problem occured
+    if laws_list_link is None:
+        return 0
+    # Click on button
+    laws_list_link.click()
+    # List the existing downloads once per language and check membership
+    # in the loop, instead of one stat() syscall per law
+    already = set(os.listdir(destination_dir(language, 'txt')))
+    # Keep track of total laws and listing pages
+    laws_ttl = 0
+    listings_num = 0
+    # Initialize IDs (use proxy - their date) of listing pages
+    this_page = '.'
+    old_page = ''
+    # Switch to main frame for later navigation
+    bot.switch_to_default()
+
+    # Iterate through all the listing pages for this language
+    while this_page != old_page: # Next listing page is available
+        # Access & collect link to each law on the page
+        # Switch to frame
+        listings_num += 1
+        print(f'\nOn the listing page number {listings_num}')
 
-            try:
-                bot.switch_to_frame("//frame[@name='Body']")
-                all_links = bot.find_xpath("//input[@type='submit' and @name='numac']")
-                laws_ttl = laws_ttl + len(all_links)
-                print(f'Laws to download on the page: {len(all_links)}')
-                print(f'{laws_ttl} laws discovered so far in total')
-
-                # Iterate over all download links; click on it, scrape the law, come back to previous page
-                for i in range(len(all_links)): # For testing purposes, use: range(0, 1):
-                    # Click on law, access page
-                    all_links[i].click()
-                    # Switch to frame containing heading/title
-                    bot.switch_to_frame("//frame[@name='Body']")
-                    # Get title
-                    law_title = bot.find_xpath_solo("/html/body/h3/center/u").text
-                    # Announce law
-                    print(f'\nFound law ({i+1}/{len(all_links)}): ', law_title)
-                    # Write text file
-                    # Get html text
-                    text_html = bot.get_html()
-                    # Use Beautiful Soup to get Unicode string
-                    soup = BeautifulSoup(text_html, features="html.parser")
-                    text_soup = soup.get_text()
-                    # Display what it's about
-                    content_extract = text_soup[300:500]
-                    print('It is about: ', content_extract)
-                    # Create file
-                    destination_file = create_destination_file(law_name=law_title, law_text=content_extract, type='txt', language=language)
-                    if destination_file is not None:
-                        with open(destination_file, 'w') as f:
-                            f.write(text_soup)
-                        # Add entry metadata for this law
-                        append_to_metadata(law_title, file_source_url, destination_file, language)
-
-                    # Exit frame and go back to listing
-                    bot.switch_to_default()
-                    bot.switch_to_frame("//frame[@name='Foot']")
-                    # Click button to go back to listing
-                    button_back = bot.find_xpath_solo("/html/body/table/tbody/tr/td[4]/form/input[5]")
-                    button_back.click()
-                    # Switch to listing frame
-                    bot.switch_to_default()
-                    bot.switch_to_frame("//frame[@name='Body']")
-                    # Recollect all links
-                    all_links = bot.find_xpath("//input[@type='submit' and @name='numac']")
-            except:
-               print("\nNo laws accessible on this listing page. Moving on to the next.\n")
-            try:
-                # Go to next listing page - click button
+        try:
+            bot.switch_to_frame('Body')
+            # Grab every numac value in one javascript round-trip -
+            # much cheaper than one get_attribute call per button
+            numacs = bot.driver.execute_script(
+                "return Array.from(document.querySelectorAll('input[type=submit][name=numac]')).map(e => e.value)")
+            laws_ttl = laws_ttl + len(numacs)
+            print(f'Laws to download on the page: {len(numacs)}')
+            print(f'{laws_ttl} laws discovered so far in total')
+
+            # Iterate over the numac values; navigate to each law, scrape it, come back to previous page
+            for i, numac in enumerate(numacs): # For testing purposes, use: numacs[0:1]
+                # Skip laws processed on a previous run - an 8-byte
+                # hash lookup instead of a navigation round-trip
+                law_hash = url_hash(language + ':' + numac)
+                if law_hash in seen:
+                    print(f'Law {numac} already processed. Skipping.')
+                    continue
+                # Capture the listing body so the wait below can detect
+                # when navigation has replaced it
+                listing_anchor = bot.wait_for('/html/body')
+                # Navigate by clicking the law's own submit button from
+                # javascript - one round-trip, and the browser posts the
+                # button's name/value pair exactly as a manual click would
+                bot.driver.execute_script(
+                    "document.querySelector(\"input[name='numac'][value='\""
+                    " + CSS.escape(arguments[0]) + \"']\").click();", numac)
+                # The scripted click returns immediately - wait for the law
+                # page to actually replace the listing before reading it
+                bot.wait_until_stale(listing_anchor)
+                # Switch to frame containing heading/title
                 bot.switch_to_default()
-                bot.switch_to_frame("//frame[@name='Foot']")
-                # Get date of this listing page (also found in the footer)
-                old_page = this_page
-                this_page = bot.find_xpath_solo("//input[@type='text' and @name='pub_date']").get_attribute("value")
-                print('\nThis listing page was published on:', this_page)
-                # Navigate to next page
-                button_next = bot.find_xpath_solo("//input[@type='Submit' and @value='Sommaire précédent' or @value='Vorige Inhoud' or @value='Voriger Inhalt']")
-                button_next.click()
-            except:
-               print("No next page could be accessed.")
-               break
-    # Write all metadata to JSON
-    write_metadata_json()
-    print(f'\n{laws_ttl} laws discovered in total')
+                bot.switch_to_frame('Body')
+                # Get title
+                law_title = bot.wait_for("/html/body/h3/center/u").text
+                # Announce law
+                print(f'\nFound law ({i+1}/{len(numacs)}): ', law_title)
+                # Write text file
+                # Read the rendered text straight off the body element -
+                # Selenium sends only the text over the wire, so there is
+                # no full-DOM serialization and no html parsing at all
+                text_soup = bot.wait_for('/html/body').text
+                # Display what it's about
+                content_extract = text_soup[300:500]
+                print('It is about: ', content_extract)
+                # Create file
+                destination_file = create_destination_file(law_name=law_title, law_text=content_extract, type='txt', language=language, already=already)
+                if destination_file is not None:
+                    # Encode once and write bytes through a large buffer -
+                    # no codec state machine or newline translation per write
+                    with open(destination_file, 'wb', buffering=65536) as f:
+                        f.write(text_soup.encode('utf-8'))
+                    # Add entry metadata for this law
+                    append_to_metadata(law_title, file_source_url, destination_file, language)
+
+                # Exit frame and go back to the listing: reach into the Foot
+                # frame from the top document and click the back button in a
+                # single javascript round-trip, instead of a frame switch, an
+                # element lookup and a click as three separate commands
+                bot.switch_to_default()
+                bot.driver.execute_script(
+                    "window.frames['Foot'].document"
+                    ".querySelectorAll('td:nth-child(4) form input')[4].click();")
+                # The scripted click returns immediately - poll from the top
+                # document until the listing's numac buttons are back (an
+                # element captured inside the frame cannot gate this: used
+                # from the top context it always reads as stale)
+                try:
+                    WebDriverWait(bot.driver, 5, ignored_exceptions=(WebDriverException,)).until(
+                        lambda driver: driver.execute_script(
+                            "return window.frames['Body'].document"
+                            ".querySelector(\"input[name='numac']\") !== null"))
+                except TimeoutException:
+                    print('FAILED: the listing page did not come back after the back button.')
+                # Switch back to the listing frame for the next law;
+                # the numac values are already in hand, nothing to recollect
+                bot.switch_to_frame('Body')
+                # Remember this law so future runs skip it outright
+                record_seen(seen, law_hash)
+        except:
+            print("\nNo laws accessible on this listing page. Moving on to the next.\n")
+        try:
+            # Go to next listing page: read this page's date (also found in
+            # the footer) and click the next button through the Foot frame,
+            # all in one javascript round-trip
+            bot.switch_to_default()
+            old_page = this_page
+            this_page = bot.driver.execute_script(
+                "var doc = window.frames['Foot'].document;"
+                "var date = doc.querySelector(\"input[name='pub_date']\").value;"
+                "doc.querySelector(\"input[value='Sommaire précédent'],"
+                " input[value='Vorige Inhoud'], input[value='Voriger Inhalt']\").click();"
+                "return date;")
+            print('\nThis listing page was published on:', this_page)
+            # The scripted click returns immediately - wait until the footer
+            # shows a different date than the page we just left. On the last
+            # listing page nothing ever changes, and the while condition
+            # ends the crawl at the next comparison.
+            try:
+                WebDriverWait(bot.driver, 5, ignored_exceptions=(WebDriverException,)).until(
+                    lambda driver: driver.execute_script(
+                        "return window.frames['Foot'].document"
+                        ".querySelector(\"input[name='pub_date']\").value") != this_page)
+            except TimeoutException:
+                pass
+        except:
+            print("No next page could be accessed.")
+            break
+    # Metadata has been streamed to this language's jsonl file along the way
+    print(f'\n{laws_ttl} laws discovered in {language} in total')
+    return laws_ttl
+
+def scrape_belgium_language(language, headless=True):
+    """Scrape all Belgian laws in one language from www.ejustice.just.fgov.be"""
+
+    print(f'\nSearching for laws in {language}')
+    # Get this process's Selenium Chrome bot
+    bot = get_bot(headless)
+    try:
+        return crawl_belgium_language(bot, language)
+    finally:
+        # Pool workers exit via os._exit, which skips atexit handlers -
+        # quit Chrome explicitly so runs don't leak browser process trees
+        bot.driver.quit()
+
+def scrape_belgium_laws(headless=True):
+    """Scrape all Belgian laws from www.ejustice.just.fgov.be
+
+    The three language trees are independent, so each one gets its own
+    process (and its own Chrome) and they run concurrently.
+    """
+    with concurrent.futures.ProcessPoolExecutor(max_workers=len(LANGUAGES)) as executor:
+        # functools.partial forwards the headless flag to every worker
+        totals = list(executor.map(functools.partial(scrape_belgium_language, headless=headless),
+                                   list(LANGUAGES)))
+    # Combine the per-language metadata written by the workers
+    merge_metadata()
+    print(f'\n{sum(totals)} laws discovered in total')
     print('\nCode finished running!\n')
 
 if __name__ == '__main__':